@@ -15,12 +15,12 @@ from __future__ import annotations
 import sys
 import json
 import os
+import queue
 import random
 import sqlite3
 import shutil
 import threading
-import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
@@ -28,6 +28,25 @@ import pyttsx3
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+# 可选：安装了 orjson 则用它做 JSON 读写（更快），否则退回标准库 json
+try:
+    import orjson
+
+    def _dump(data, path: Path):
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)  # 先序列化，失败时不会清空原文件
+        with path.open("wb") as f:
+            f.write(payload)
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:
+    def _dump(data, path: Path):
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
 # -------------------- 路径配置 --------------------
 # ① 打包后 exe 所在目录 = 词库根目录（源码运行则用脚本所在目录）
 if getattr(sys, 'frozen', False):          # PyInstaller 打包后 sys.frozen 为 True
@@ -43,20 +62,40 @@ DB_FILE = BASE_DIR / "stats.db"            # SQLite 统计数据库路径（与
 
 
 # ==================== 数据层 ====================
-@dataclass
+@dataclass(slots=True)
 class Word:
     word: str
     meaning: str
+    word_lower: str = field(init=False, repr=False, compare=False)  # 判题用，加载时算一次
+
+    def __post_init__(self):
+        self.word_lower = self.word.casefold()
 
 
 
 class Stats:
     """SQLite 统计：按 库名+单词 记录"""
+    # 常用语句定义为类常量，文本不变便于 sqlite3 语句缓存复用
+    # UPSERT：不存在则插入，存在则累加
+    _SQL_UPSERT = (
+        "INSERT INTO record (lib_name, word, correct, total) VALUES (?, ?, ?, 1) "
+        "ON CONFLICT (lib_name, word) DO UPDATE SET "
+        "correct = correct + excluded.correct, total = total + 1"
+    )
+    _SQL_GET = "SELECT correct, total FROM record WHERE lib_name=? AND word=?"
+    _SQL_LIB_AGG = "SELECT SUM(correct), SUM(total) FROM record WHERE lib_name=?"
+
     def __init__(self, db: Path = DB_FILE):
         self.conn = sqlite3.connect(db, check_same_thread=False)
+        self._lock = threading.Lock()  # 连接可跨线程使用，写操作需串行
         self._init_table()
 
     def _init_table(self):
+        # 单写者交互程序：WAL + NORMAL 同步，避免每次提交都 fsync
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
         # 建表：库名、单词、正确数、总次数
         self.conn.execute(
             """
@@ -69,41 +108,33 @@ class Stats:
             )
             """
         )
+        # 覆盖索引：按库聚合时无需回表
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_record_lib ON record (lib_name, correct, total)"
+        )
         self.conn.commit()
 
     def update(self, lib: str, word: str, correct: bool):
-        with self.conn:
-            cur = self.conn.execute(
-                "SELECT correct, total FROM record WHERE lib_name=? AND word=?",
-                (lib, word),
-            )
-            row = cur.fetchone()
-            if row:
-                c, t = row
-                self.conn.execute(
-                    "UPDATE record SET correct=?, total=? WHERE lib_name=? AND word=?",
-                    (c + int(correct), t + 1, lib, word),
-                )
-            else:
-                self.conn.execute(
-                    "INSERT INTO record (lib_name, word, correct, total) VALUES (?, ?, ?, ?)",
-                    (lib, word, int(correct), 1),
-                )
+        with self._lock, self.conn:
+            self.conn.execute(self._SQL_UPSERT, (lib, word, int(correct)))
+
+    def update_many(self, lib: str, results: List[Tuple[str, bool]]):
+        """批量写入多条答题结果（单事务 + executemany）"""
+        if not results:
+            return
+        with self._lock, self.conn:
+            self.conn.executemany(self._SQL_UPSERT, [(lib, w, int(c)) for w, c in results])
 
     def get(self, lib: str, word: str) -> Tuple[int, int]:
-        cur = self.conn.execute(
-            "SELECT correct, total FROM record WHERE lib_name=? AND word=?",
-            (lib, word),
-        )
+        cur = self.conn.execute(self._SQL_GET, (lib, word))
         row = cur.fetchone()
         return row if row else (0, 0)
 
-    def get_lib_stats(self, lib: str) -> Dict[str, Tuple[int, int]]:
-        """返回整个库的所有单词统计"""
-        cur = self.conn.execute(
-            "SELECT word, correct, total FROM record WHERE lib_name=?", (lib,)
-        )
-        return {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+    def get_lib_total(self, lib: str) -> Tuple[int, int]:
+        """返回整个库的 (正确数, 总次数) 合计"""
+        cur = self.conn.execute(self._SQL_LIB_AGG, (lib,))
+        c, t = cur.fetchone()
+        return (c or 0, t or 0)
 
     def close(self):
         self.conn.close()
@@ -114,36 +145,71 @@ class DictationCore:
     """与界面解耦的核心逻辑"""
     def __init__(self):
         self.stats = Stats()
-        self.engine = self._init_tts()
-
-    def _init_tts(self) -> pyttsx3.Engine:
-        try:
+        self._lib_cache: Dict[str, Tuple[int, List[Word]]] = {}  # 库名 -> (mtime_ns, 单词列表)
+        self._libs_cache: Optional[List[str]] = None  # 词库名列表
+        self._libs_mtime: int = 0                     # 缓存时 LIBS_DIR 的 mtime_ns
+        self.engine: Optional[pyttsx3.Engine] = None  # 由朗读线程在首次朗读时初始化，加快启动
+        # pyttsx3 引擎不可重入：所有朗读请求排队交给同一个后台线程
+        self._tts_q: "queue.Queue[Tuple[str, int]]" = queue.Queue()
+        # 朗读线程的报错：工作线程不能操作 Tk，由界面层定时取出显示
+        self.tts_errors: "queue.Queue[Exception]" = queue.Queue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
+
+    def _ensure_engine(self) -> pyttsx3.Engine:
+        """只在朗读线程中调用：引擎（SAPI5 为 COM 对象）由使用它的线程创建"""
+        if self.engine is None:
             engine = pyttsx3.init()
             engine.setProperty("rate", 130)
             engine.setProperty("volume", 0.9)
-            return engine
-        except Exception as e:
-            messagebox.showerror("TTS 错误", f"语音引擎初始化失败:\n{e}")
-            raise
-
-    def speak(self, word: str, repeat: int = 2):
-        for i in range(repeat):
-            self.engine.say(word)
-            self.engine.runAndWait()
-            if i < repeat - 1:
-                time.sleep(0.3)
+            self.engine = engine
+        return self.engine
+
+    def _tts_worker(self):
+        while True:
+            word, repeat = self._tts_q.get()
+            try:
+                engine = self._ensure_engine()
+                for _ in range(repeat):
+                    engine.say(word)
+                    engine.runAndWait()
+            except Exception as e:  # 出错不退出线程，否则之后再也无法朗读
+                self.tts_errors.put(e)
+
+    def speak(self, word: str, repeat: int = 2, interrupt: bool = False):
+        """排队朗读，立即返回不阻塞界面；interrupt=True 时丢弃尚未朗读的旧请求"""
+        if interrupt:
+            try:
+                while True:
+                    self._tts_q.get_nowait()
+            except queue.Empty:
+                pass
+        self._tts_q.put((word, repeat))
 
     # 工具：扫描本地词库
-    def scan_local_libs(self) -> List[str]:
-        """返回本地 JSON 文件名列表（不含扩展名）"""
-        return [p.stem for p in LIBS_DIR.glob("*.json")]
+    def scan_local_libs(self, force: bool = False) -> List[str]:
+        """返回本地 JSON 文件名列表（不含扩展名）；force=True 时忽略缓存重新扫描"""
+        mtime = LIBS_DIR.stat().st_mtime_ns
+        if force or self._libs_cache is None or mtime != self._libs_mtime:
+            self._libs_cache = [p.stem for p in LIBS_DIR.iterdir() if p.suffix == ".json" and p.is_file()]
+            self._libs_mtime = mtime
+        return list(self._libs_cache)  # 返回副本，调用方修改不影响缓存
 
     def load_lib(self, lib_name: str) -> List[Word]:
         """根据库名加载单词列表"""
         path = LIBS_DIR / f"{lib_name}.json"
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
-        return [Word(**w) for w in data["words"]]
+        mtime = path.stat().st_mtime_ns
+        cached = self._lib_cache.get(lib_name)
+        if cached and cached[0] == mtime:
+            return list(cached[1])  # 返回副本，调用方修改不影响缓存
+        data = _loads(path.read_bytes())
+        words = [Word(**w) for w in data["words"]]
+        self._lib_cache[lib_name] = (mtime, words)
+        return list(words)
+
+    def invalidate_lib(self, lib_name: str):
+        """词库文件被改写后丢弃缓存"""
+        self._lib_cache.pop(lib_name, None)
+        self._libs_cache = None
 
     def import_external_json(self, src: Path) -> str:
         """
@@ -164,6 +230,7 @@ class DictationCore:
             counter += 1
 
         shutil.copy(src, dst)
+        self.invalidate_lib(dst_name)
         return dst_name
 
 
@@ -175,8 +242,14 @@ class MainApp:
         self.root.title("English Dictation 多词库版")
         self.root.geometry("700x500")
         self.root.minsize(600, 400)
+        # 右侧列表当前对应的词库及单词（与 word_listbox 行号一一对应）
+        self._current_lib: Optional[str] = None
+        self._current_words: List[Word] = []
+        self._current_display: List[str] = []
+        self._lib_index: Dict[str, int] = {}  # 库名 -> lib_listbox 行号
         self._build_ui()
         self.refresh_lib_list()
+        self._poll_tts_errors()
 
     # ---------- 界面构建 ----------
     def _build_ui(self):
@@ -188,7 +261,7 @@ class MainApp:
         ttk.Button(frm_top, text="➕ 新建词库", command=self.on_create).pack(side="left", padx=5)
         ttk.Button(frm_top, text="💾 导出词库", command=self.on_export).pack(side="left", padx=5)
         ttk.Button(frm_top, text="✏️ 编辑词库", command=self.on_edit).pack(side="left", padx=5)  # ←新增
-        ttk.Button(frm_top, text="🔄 刷新列表", command=self.refresh_lib_list).pack(side="left", padx=5)
+        ttk.Button(frm_top, text="🔄 刷新列表", command=lambda: self.refresh_lib_list(force=True)).pack(side="left", padx=5)
         ttk.Button(frm_top, text="📊 查看统计", command=self.show_stats).pack(side="left", padx=5)
 
         # 左：词库选择
@@ -221,12 +294,24 @@ class MainApp:
         ttk.Label(self.root, textvariable=self.status, relief="sunken").pack(side="bottom", fill="x")
 
     # ---------- 事件处理 ----------
-    def refresh_lib_list(self):
-        """扫描本地词库并刷新 Listbox"""
+    def _poll_tts_errors(self):
+        """定时取出朗读线程的报错并在 Tk 主线程弹窗（积压多条只显示最后一条）"""
+        err = None
+        try:
+            while True:
+                err = self.core.tts_errors.get_nowait()
+        except queue.Empty:
+            pass
+        if err is not None:
+            messagebox.showerror("TTS 错误", f"语音引擎出错:\n{err}")
+        self.root.after(200, self._poll_tts_errors)
+
+    def refresh_lib_list(self, force: bool = False):
+        """扫描本地词库并刷新 Listbox（force=True：用户手动刷新，必定重新扫描目录）"""
         self.lib_listbox.delete(0, tk.END)
-        libs = self.core.scan_local_libs()
-        for lib in libs:
-            self.lib_listbox.insert(tk.END, lib)
+        libs = self.core.scan_local_libs(force)
+        self._lib_index = {lib: i for i, lib in enumerate(libs)}
+        self.lib_listbox.insert(tk.END, *libs)
         self.status.set(f"共发现 {len(libs)} 个词库")
 
     # ========== 新增：查看统计 ==========
@@ -237,13 +322,15 @@ class MainApp:
             messagebox.showinfo("提示", "请先选择一个词库")
             return
         lib = self.lib_listbox.get(selection[0])
-        stats_dict = self.core.stats.get_lib_stats(lib)
-        if not stats_dict:
+        # 先把仍打开的听写窗口中缓冲的答题结果写入数据库
+        for win in self.root.winfo_children():
+            if isinstance(win, DictationWindow):
+                win.flush_stats()
+        total_correct, total_times = self.core.stats.get_lib_total(lib)
+        if not total_times:
             messagebox.showinfo("统计", f"词库 '{lib}' 暂无答题记录")
             return
 
-        total_correct = sum(c for c, t in stats_dict.values())
-        total_times   = sum(t for c, t in stats_dict.values())
         rate = total_correct / total_times * 100 if total_times else 0
         msg = f"词库：{lib}\n总题次：{total_times}\n正确数：{total_correct}\n正确率：{rate:.1f}%"
         messagebox.showinfo("统计", msg)
@@ -278,12 +365,15 @@ class MainApp:
             ttk.Label(frm_add, text=f"{col.title()}:").pack(side="left")
             ents[col] = tk.StringVar()
             ttk.Entry(frm_add, textvariable=ents[col], width=15).pack(side="left", padx=5)
+        added_rows: List[Dict[str, str]] = []  # 与 tree 同步的已录入单词
         # 添加按钮
         def add_to_tree():
             if not all(ents[col].get() for col in cols):
                 messagebox.showerror("缺项", "请填写全部字段", parent=top)
                 return
-            tree.insert("", tk.END, values=[ents[col].get() for col in cols])
+            row = {col: ents[col].get() for col in cols}
+            added_rows.append(row)
+            tree.insert("", tk.END, values=[row[col] for col in cols])
             for col in cols:
                 ents[col].set("")
         ttk.Button(frm_add, text="添加", command=add_to_tree).pack(side="left", padx=5)
@@ -299,20 +389,17 @@ class MainApp:
             if not name:
                 messagebox.showerror("无名称", "请输入词库名称", parent=top)
                 return
-            if not tree.get_children():
+            if not added_rows:
                 messagebox.showerror("空库", "请至少添加一个单词", parent=top)
                 return
             # 构造标准格式
-            words = []
-            for item in tree.get_children():
-                vals = tree.item(item, "values")
-                {"word": vals[0], "meaning": vals[1]}
-            data = {"words": words}
+            data = {"words": added_rows}
             dst = LIBS_DIR / f"{name}.json"
             if dst.exists():
                 if not messagebox.askyesno("覆盖", f"词库 '{name}' 已存在，是否覆盖？", parent=top):
                     return
-            dst.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            _dump(data, dst)
+            self.core.invalidate_lib(name)
             messagebox.showinfo("成功", f"词库已保存: {dst}", parent=top)
             top.destroy()
             self.refresh_lib_list()  # 立即刷新主列表
@@ -326,7 +413,7 @@ class MainApp:
             return
         lib_name = self.lib_listbox.get(selection[0])
         words = self.core.load_lib(lib_name)
-        data = {"words": [asdict(w) for w in words]}  # Word -> dict
+        data = {"words": [{"word": w.word, "meaning": w.meaning} for w in words]}  # Word -> dict
 
         file = filedialog.asksaveasfilename(
             title="导出词库",
@@ -336,7 +423,7 @@ class MainApp:
         )
         if not file:
             return
-        Path(file).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        _dump(data, Path(file))
         messagebox.showinfo("成功", f"词库已导出至:\n{file}")
     def on_import(self):
         """弹出文件选择框，导入外部 JSON"""
@@ -347,7 +434,7 @@ class MainApp:
             lib_name = self.core.import_external_json(Path(file))
             self.refresh_lib_list()
             # 自动选中新导入的库
-            idx = list(self.lib_listbox.get(0, tk.END)).index(lib_name)
+            idx = self._lib_index[lib_name]
             self.lib_listbox.selection_set(idx)
             self.on_lib_select()
             messagebox.showinfo("成功", f"已导入词库: {lib_name}")
@@ -361,9 +448,12 @@ class MainApp:
             return
         lib_name = self.lib_listbox.get(selection[0])
         words = self.core.load_lib(lib_name)
+        self._current_lib = lib_name
+        self._current_words = words
+        self._current_display = [f"{w.word}  ({w.meaning})" for w in words]
         self.word_listbox.delete(0, tk.END)
-        for w in words:
-            self.word_listbox.insert(tk.END, f"{w.word}  ({w.meaning})")
+        # 一次 Tcl 调用插入全部行，避免逐行 insert
+        self.word_listbox.insert(tk.END, *self._current_display)
         self.status.set(f"词库 '{lib_name}' 共 {len(words)} 个单词")
 
     def play_selected(self):
@@ -372,10 +462,8 @@ class MainApp:
         if not selection:
             messagebox.showinfo("提示", "请先选择要播放的单词")
             return
-        # 提取单词文本（去掉括号释义）
         for idx in selection:
-            text = self.word_listbox.get(idx).split()[0]
-            self.core.speak(text, repeat=1)
+            self.core.speak(self._current_words[idx].word, repeat=1)
 
     def start_dictation(self):
         """进入听写窗口"""
@@ -383,11 +471,9 @@ class MainApp:
         if not selection:
             messagebox.showinfo("提示", "请先选择要听写的单词（可 Ctrl+A 全选）")
             return
-        lib_name = self.lib_listbox.get(self.lib_listbox.curselection()[0])
-        words_all = self.core.load_lib(lib_name)
         # 根据索引过滤
-        selected_words = [words_all[i] for i in selection]
-        DictationWindow(self.core, lib_name, selected_words)
+        selected_words = [self._current_words[i] for i in selection]
+        DictationWindow(self.core, self._current_lib, selected_words)
 
     # ==================== 编辑词库 ====================
     def on_edit(self):
@@ -421,13 +507,32 @@ class MainApp:
             tree.column(c, width=200, anchor="center")
         tree.pack(fill="both", expand=True, padx=10, pady=5)
 
-        # 填充现有单词
-        for w in words:
-            tree.insert("", tk.END, values=(w.word, w.meaning))
+        # 填充现有单词：空闲时分批插入，大词库也能先显示窗口
+        loaded = 0
+        populate_id: Optional[str] = None  # 尚未执行的 after_idle 句柄
+        def cancel_populate():
+            nonlocal populate_id
+            if populate_id is not None:
+                tree.after_cancel(populate_id)
+                populate_id = None
+        def populate(limit: int = 500):
+            nonlocal loaded, populate_id
+            cancel_populate()  # 直接调用（保存/添加前补齐）时撤掉已排队的回调
+            end = min(loaded + limit, len(words))
+            for w in words[loaded:end]:
+                tree.insert("", tk.END, values=(w.word, w.meaning))
+            loaded = end
+            if loaded < len(words):
+                tree.update_idletasks()
+                populate_id = tree.after_idle(populate)
+        # 窗口关闭时撤掉回调，否则其 Tcl 命令已被删除，触发时报后台错误
+        top.bind("<Destroy>", lambda e: cancel_populate() if e.widget is top else None, add="+")
+        populate_id = tree.after_idle(populate)
 
         # ---------- 功能函数 ----------
         def add_word():
             """小弹窗录入新单词"""
+            populate(len(words))  # 先补齐剩余行，新词才会排在末尾
                 # 弹窗
             top_add = tk.Toplevel(top)
             top_add.title("添加单词")
@@ -449,30 +554,39 @@ class MainApp:
 
         def save():
             """把 TreeView 当前内容写回 JSON"""
+            populate(len(words))  # 尚未填充完时先补齐，避免丢词
             new_words = []
             for item in tree.get_children():
                 vals = tree.item(item, "values")
                 new_words.append({"word": vals[0], "meaning": vals[1]})
             data = {"words": new_words}
             dst = LIBS_DIR / f"{lib_name}.json"
-            dst.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            _dump(data, dst)
+            self.core.invalidate_lib(lib_name)
             messagebox.showinfo("成功", f"已保存到:\n{dst}", parent=top)
             top.destroy()
             self.refresh_lib_list()  # 刷新主列表
 # ==================== 听写子窗口 ====================
 class DictationWindow(tk.Toplevel):
+    FLUSH_EVERY = 10  # 每累计多少条答题结果写一次数据库
+
     def __init__(self, core: DictationCore, lib_name: str, words: List[Word]):
         super().__init__()
         self.core = core
         self.lib_name = lib_name
-        self.words = words
-        self.used: set[str] = set()
+        # 同一拼写只考一次（保留首个条目），预先打乱，每题弹出一个
+        self._queue: List[Word] = list({w.word: w for w in reversed(words)}.values())
+        random.shuffle(self._queue)
         self.score = 0
         self.total = 0
+        self._pending: List[Tuple[str, bool]] = []  # 尚未写入数据库的答题结果
+        self._advance_id: Optional[str] = None  # 自动下一题的 after 句柄
 
         self.current: Optional[Word] = None
 
         self.title(f"听写 - {lib_name}")
+        # 标题栏关闭默认不经过 destroy()，需显式绑定以写回统计并取消定时器
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
         self.geometry("600x400")
         self._build_ui()
         self.next_word()
@@ -514,12 +628,12 @@ class DictationWindow(tk.Toplevel):
     # ---------- 听写逻辑 ----------
     def next_word(self):
         """换题并刷新界面"""
-        if len(self.used) == len(self.words):
+        self._cancel_advance()
+        if not self._queue:
             messagebox.showinfo("完成", f"本轮结束！正确率: {self.score}/{self.total}")
             self.destroy()
             return
-        self.current = random.choice([w for w in self.words if w.word not in self.used])
-        self.used.add(self.current.word)
+        self.current = self._queue.pop()
 
 
         self.lbl_mean.config(text=self.current.meaning)
@@ -529,30 +643,65 @@ class DictationWindow(tk.Toplevel):
 
     def play_current(self):
         if self.current:
-            threading.Thread(target=self.core.speak, args=(self.current.word, 2), daemon=True).start()
+            self.core.speak(self.current.word, 2, interrupt=True)  # 换题后不再读旧词
 
     def check(self):
         if not self.current:
             return
-        user = self.var_input.get().strip().lower()
+        user = self.var_input.get().strip().casefold()
         if not user:
             messagebox.showinfo("提示", "请输入拼写！")
             return
 
-        correct = user == self.current.word.lower()
-        self.core.stats.update(self.lib_name, self.current.word, correct)
-        c, t = self.core.stats.get(self.lib_name, self.current.word)
+        correct = user == self.current.word_lower
+        self._pending.append((self.current.word, correct))
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush_stats()
+        c, t = self._word_stats(self.current.word)
         rate = c / t * 100 if t else 0
         self.total += 1
         if correct:
             self.score += 1
             self.lbl_stat.config(text=f"✅ 正确！（对该词正确率 {rate:.0f}%）", foreground="green")
-            # 2 秒后自动下一题
-            self.after(2000, self.next_word)
+            # 2 秒后自动下一题（重复答对只保留一个定时器）
+            self._cancel_advance()
+            self._advance_id = self.after(2000, self._advance)
         else:
             messagebox.showerror("错误", f"正确答案：{self.current.word}")
             self.lbl_stat.config(text=f"❌ 错误（对该词正确率 {rate:.0f}%）", foreground="red")
 
+    def _advance(self):
+        self._advance_id = None
+        self.next_word()
+
+    def _cancel_advance(self):
+        if self._advance_id:
+            self.after_cancel(self._advance_id)
+            self._advance_id = None
+
+    # ---------- 统计缓冲 ----------
+    def _word_stats(self, word: str) -> Tuple[int, int]:
+        """数据库中的统计 + 缓冲区中尚未写入的结果"""
+        c, t = self.core.stats.get(self.lib_name, word)
+        for w, ok in self._pending:
+            if w == word:
+                c += int(ok)
+                t += 1
+        return c, t
+
+    def flush_stats(self):
+        """把缓冲的答题结果一次性写入数据库"""
+        if self._pending:
+            self.core.stats.update_many(self.lib_name, self._pending)
+            self._pending = []
+
+    def destroy(self):
+        self._cancel_advance()
+        try:
+            self.flush_stats()
+        finally:
+            super().destroy()
+
 
 # ==================== 入口 ====================
 def main():